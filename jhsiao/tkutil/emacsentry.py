@@ -5,7 +5,6 @@ import sys
 import bisect
 from .util import subclass, class_bind, local_callbacks
 from .. import exports
-import functools
 
 if sys.version_info.major > 2:
     import tkinter as tk
@@ -42,62 +41,101 @@ class EmacsText(tk.Text):
         kwargs.setdefault('wrap', 'none')
         tk.Text.__init__(self, *args, **kwargs)
         subclass(self, EmacsText)
+        # False if the mark is definitely not set.
+        self._has_mark = False
         if not self.bind_class(EmacsText.__name__):
             class_bind(self, EmacsText, EmacsText.__behavior())
 
     @staticmethod
-    def __wrap(sequence, func):
-        """wrap func to ignore when not self.edit('modified')."""
-        if (
-            sequence is not None
-            and sequence == '<<Modified>>'
-            and func is not None):
-
-            _func = func
-            def func(e):
-                if e.widget.edit('modified'):
-                    return _func(e)
-            try:
-                func = functools.wraps(_func)(func)
-            except:
-                pass
-        return func
+    def __guarded(sequence, func):
+        """Return whether func should only fire when modified."""
+        return (
+            sequence == '<<Modified>>'
+            and func is not None
+            and not isinstance(func, str))
+
+    @staticmethod
+    def __script(widget, func, add, needcleanup):
+        """Register func and return (funcid, script).
+
+        The script checks the modified flag in Tcl so func is not
+        called at all when the flag was only being cleared.
+        """
+        funcid = widget._register(func, widget._substitute, needcleanup)
+        return funcid, (
+            '{}if {{[%W edit modified]}} '
+            '{{if {{"[{} {}]" == "break"}} break}}\n').format(
+                '+' if add else '', funcid, widget._subst_format_str)
+
     def bind(self, sequence=None, func=None, add=None):
-        tk.Text.bind(self, sequence, self.__wrap(sequence, func), add)
+        if self.__guarded(sequence, func):
+            funcid, script = self.__script(self, func, add, 1)
+            tk.Text.bind(self, sequence, script)
+            return funcid
+        return tk.Text.bind(self, sequence, func, add)
     def bind_class(self, className, sequence=None, func=None, add=None):
-        tk.Text.bind_class(
-            self, className, sequence, self.__wrap(sequence, func), add)
+        if self.__guarded(sequence, func):
+            funcid, script = self.__script(self._root(), func, add, 0)
+            tk.Text.bind_class(self, className, sequence, script)
+            return funcid
+        return tk.Text.bind_class(self, className, sequence, func, add)
 
     @staticmethod
     def __behavior():
         _MARK = '_mark'
+        _WORD = r'\w'
+        # Tcl lambdas taking the widget and mark name so each callback
+        # is a single Tcl call instead of several compares.
+        _UPDATE_SELECTION = (
+            '{w m} {'
+            ' if {$m ni [$w mark names]} return;'
+            ' if {[$w compare insert < $m]} {set r [list insert $m]}'
+            ' else {set r [list $m insert]};'
+            ' $w tag remove sel 1.0 end;'
+            ' $w tag add sel {*}$r}')
+        _CHECK_SELECTION = (
+            '{w m} {'
+            ' if {$m ni [$w mark names]} return;'
+            ' set r [$w tag ranges sel];'
+            ' if {![llength $r]} return;'
+            ' set f [lindex $r 0]; set l [lindex $r end];'
+            ' if {([$w compare $m != $f] && [$w compare insert != $f])'
+            ' || ([$w compare $m != $l] && [$w compare insert != $l])}'
+            ' {$w mark unset $m}}')
+        _KILL = (
+            '{w first last} {'
+            ' set data [$w get $first $last];'
+            ' if {$data eq {}} return;'
+            ' clipboard clear -displayof $w;'
+            ' clipboard append -displayof $w -- $data;'
+            ' $w delete $first $last}')
         def keypress_callback(callback):
             """Decorate callback to make cursor visible, return 'break'"""
             def keypress(event):
                 self = event.widget
                 callback(self)
-                self.see('insert')
+                self.tk.call(self._w, 'see', 'insert')
                 return 'break'
             return keypress
 
         def update_selection(self):
             """Select from insert to mark."""
-            if _MARK not in self.mark_names():
-                return
-            if self.compare('insert', '<', _MARK):
-                sel = ('insert', _MARK)
-            else:
-                sel = (_MARK, 'insert')
-            if self.tag_ranges('sel'):
-                self.tag_remove('sel', 'sel.first', 'sel.last')
-            self.tag_add('sel', *sel)
+            if self._has_mark:
+                self.tk.call('apply', _UPDATE_SELECTION, self._w, _MARK)
+
+        def kill(self, first, last):
+            """Cut text from first to last to the clipboard."""
+            self.tk.call('apply', _KILL, self._w, first, last)
 
         def _prev_word(self):
-            nxtw = self.search(r'\w', 'insert', '1.0', regexp=True, backwards=True)
+            nxtw = str(self.tk.call(
+                self._w, 'search', '-backwards', '-regexp', '--',
+                _WORD, 'insert', '1.0'))
             return nxtw + ' wordstart' if nxtw else '1.0'
 
         def _next_word(self):
-            nxtw = self.search(r'\w', 'insert', 'end', regexp=True)
+            nxtw = str(self.tk.call(
+                self._w, 'search', '-regexp', '--', _WORD, 'insert', 'end'))
             return nxtw + ' wordend' if nxtw else 'end'
 
         def _vcb_Modified(event):
@@ -105,23 +143,16 @@ class EmacsText(tk.Text):
             # Clearing the modified flag causes another
             # <<Modified>> event to be fired.
             self = event.widget
-            self.mark_unset(_MARK)
+            if self._has_mark:
+                self._has_mark = False
+                self.mark_unset(_MARK)
             self.edit('modified', 0)
 
         def _vcb_Selection(event):
             """Clear mark if selection changed externally."""
             self = event.widget
-            if _MARK not in self.mark_names():
-                return
-            if self.tag_ranges('sel'):
-                mismatched_first = (
-                    self.compare(_MARK, '!=', 'sel.first')
-                    and self.compare('insert', '!=', 'sel.first'))
-                mismatched_last = (
-                    self.compare(_MARK, '!=', 'sel.last')
-                    and self.compare('insert', '!=', 'sel.last'))
-                if mismatched_first or mismatched_last:
-                    self.mark_unset(_MARK)
+            if self._has_mark:
+                self.tk.call('apply', _CHECK_SELECTION, self._w, _MARK)
 
         @keypress_callback
         def _cb_Control_y(self):
@@ -130,45 +161,36 @@ class EmacsText(tk.Text):
         @keypress_callback
         def _cb_Control_w(self):
             if self.tag_ranges('sel'):
-                self.clipboard_clear()
-                self.clipboard_append(
-                    self.get('sel.first', 'sel.last'))
-                self.delete('sel.first', 'sel.last')
+                kill(self, 'sel.first', 'sel.last')
             else:
-                prev = _prev_word(self)
-                data = self.get(prev, 'insert')
-                if data:
-                    self.clipboard_clear()
-                    self.clipboard_append(data)
-                    self.delete(prev, 'insert')
+                kill(self, _prev_word(self), 'insert')
 
         @keypress_callback
         def _cb_Control_k(self):
-            data = self.get('insert', 'insert lineend')
-            if data:
-                self.clipboard_clear()
-                self.clipboard_append(data)
-                self.delete('insert', 'insert lineend')
+            kill(self, 'insert', 'insert lineend')
 
         @keypress_callback
         def _cb_Control_d(self):
-            self.delete('insert')
+            self.tk.call(self._w, 'delete', 'insert')
 
         @keypress_callback
         def _cb_Control_space(self):
             if (
-                _MARK in self.mark_names()
+                self._has_mark
+                and _MARK in self.mark_names()
                 and self.compare(_MARK, '==', 'insert')):
 
+                self._has_mark = False
                 self.mark_unset(_MARK)
             else:
+                self._has_mark = True
                 self.mark_set(_MARK, 'insert')
                 update_selection(self)
 
         def move(dst):
             @keypress_callback
             def func(self):
-                self.mark_set('insert', dst)
+                self.tk.call(self._w, 'mark', 'set', 'insert', dst)
                 update_selection(self)
             return func
 
@@ -181,22 +203,17 @@ class EmacsText(tk.Text):
 
         @keypress_callback
         def _cb_Alt_f(self):
-            self.mark_set('insert', _next_word(self))
+            self.tk.call(self._w, 'mark', 'set', 'insert', _next_word(self))
             update_selection(self)
 
         @keypress_callback
         def _cb_Alt_b(self):
-            self.mark_set('insert', _prev_word(self))
+            self.tk.call(self._w, 'mark', 'set', 'insert', _prev_word(self))
             update_selection(self)
 
         @keypress_callback
         def _cb_Alt_d(self):
-            nxt = _next_word(self)
-            data = self.get('insert', nxt)
-            if data:
-                self.clipboard_clear()
-                self.clipboard_append(data)
-                self.delete('insert', nxt)
+            kill(self, 'insert', _next_word(self))
         return local_callbacks(locals())
 
 @public
@@ -16,25 +16,9 @@ else:
     from itertools import izip as zip
     import tkFont as font
     range = xrange
-    chr = unichr
-    _max = max
-    def max(*args, **kwargs):
-        default = kwargs.pop('default', None)
-        try:
-            return _max(*args, **kwargs)
-        except ValueError:
-            if default is not None:
-                return default
-            raise
 
 public = public(__all__)
 
-class IDInd(object):
-    def __getitem__(self, i):
-        return i
-
-idind = IDInd()
-
 _LOWER = 0
 _RAW = 1
 _LABEL = 2
@@ -72,7 +56,9 @@ class ItemSelector(Scrollframe):
         kwargs.setdefault('showy', False)
         Scrollframe.__init__(self, *args, **kwargs)
         subclass(self, ItemSelector)
-        class_bind(self, ItemSelector, dict(Configure=self._arrange))
+        class_bind(
+            self, ItemSelector,
+            dict(Configure=self._arrange, Destroy=self._destroyed))
         self._scrollframe = Scrollframe(self)
         self._labelstyle = labelstyle
         self._selected = dict(
@@ -84,69 +70,150 @@ class ItemSelector(Scrollframe):
         self._labelstyle.setdefault(
             'font', font.nametofont('TkDefaultFont'))
         self._labelstyle.update(self._LABEL_PROPERTIES)
+        self._update_argv()
         self._data = [[], [], [], [], []]
-        self._longest = 0
+        # label indices currently painted as selected
+        self._painted = set()
+        # after_idle id of a deferred repaint
+        self._idle = None
+        # cached prefix ranges for (lowers, raws)
+        self._ranges = ({}, {})
+        # (column, row) each label was last gridded at, None if not
+        self._placed = []
+        # text each label currently shows, None if unset
+        self._texts = []
+        # the current choices, to skip redundant updates
+        self._choices = None
         self.frame.configure(background=self._unselected['background'])
         self._prep_choices(choices)
 
-    def _next_prefix(self, s):
-        """Return the next string (increment last char/extend length)
+    @staticmethod
+    def _prefix_stop(arr, val, start, hi):
+        """Return the end of the run of items starting with val.
 
-        If the last char is the last representable char (sys.maxunicode)
-            then append the last char until length + 1
-        NOTE: could wrap around and increment second-to-last if last char
-        is the last representable char, but this method is simpler
+        arr[start:hi] is sorted and arr[start] is the first item >= val
+        so matches are contiguous from start.  Gallop forward while
+        items match, then bisect the last step.  This is only a few
+        comparisons when there are few matches.
         """
-        if s:
-            try:
-                nxt = chr(ord(s[-1]) + 1)
-            except ValueError:
-                return s + (s[-1] * (1 + self._longest - len(s)))
+        if start >= hi or not arr[start].startswith(val):
+            return start
+        lo = start
+        bound = hi
+        step = 1
+        while lo + step < hi:
+            if arr[lo + step].startswith(val):
+                lo += step
+                step *= 2
             else:
-                return s[:-1] + nxt
-        else:
-            return chr(sys.maxunicode) * (self._longest + 1)
+                bound = lo + step
+                break
+        while bound - lo > 1:
+            mid = (lo + bound) // 2
+            if arr[mid].startswith(val):
+                lo = mid
+            else:
+                bound = mid
+        return bound
+
+    def _prefix_range(self, arr, val, cache):
+        """Return (start, stop) of the items in arr starting with val.
+
+        Ranges are cached per val.  Matches of val are a subset of the
+        matches of val[:-1] so only that range is searched if cached
+        (typing a query extends it one char at a time).
+        """
+        rng = cache.get(val)
+        if rng is None:
+            full = (0, len(arr))
+            lo, hi = cache.get(val[:-1], full) if val else full
+            start = bisect.bisect_left(arr, val, lo, hi)
+            rng = cache[val] = (start, self._prefix_stop(arr, val, start, hi))
+        return rng
+
+    def _update_argv(self):
+        """Build Tcl configure args for (un)selected labels.
+
+        Labels are recolored with tk.call using these to avoid the
+        kwargs handling of configure() per label.
+        """
+        self._selected_argv = (
+            '-background', self._selected['background'],
+            '-foreground', self._selected['foreground'])
+        self._unselected_argv = (
+            '-background', self._unselected['background'],
+            '-foreground', self._unselected['foreground'])
 
     def _prep_choices(self, choices):
         """Organize data into case (in)sensitive lists/labels."""
-        choices = set(choices)
+        choices = frozenset(choices)
+        if choices == self._choices:
+            return
+        self._choices = choices
+        self._cancel_repaint()
         lowers, raws, labels, Linds, Rinds = self._data
+        texts = self._texts
         if len(labels) < len(choices):
             for i in range(len(labels), len(choices)):
                 labels.append(tk.Label(self.frame, **self._labelstyle))
+                self._placed.append(None)
+                texts.append(None)
         tmp = sorted((choice.lower(), choice) for choice in choices)
-        for x, lbl in zip(tmp, labels):
-            lbl.configure(text=x[_RAW], **self._selected)
+        # Everything starts selected, skip colors already painted
+        # and text already shown.
+        painted = self._painted
+        call = self.tk.call
+        selected = self._selected_argv
+        for i, (x, lbl) in enumerate(zip(tmp, labels)):
+            argv = () if i in painted else selected
+            if texts[i] != x[_RAW]:
+                texts[i] = x[_RAW]
+                argv = ('-text', x[_RAW]) + argv
+            if argv:
+                call(lbl._w, 'configure', *argv)
+        self._painted = set(range(len(tmp)))
+        self._ranges = ({}, {})
         lowers[:] = (x[_LOWER] for x in tmp)
         tmp = sorted((x[_RAW], i) for i, x in enumerate(tmp))
         raws[:] = (x[0] for x in tmp)
         Linds[:] = (x[1] for x in tmp)
+        # Rinds is the inverse permutation: Rinds[Linds[i]] = i
         Rinds[:] = Linds
-        for raw, lo in enumerate(Linds):
-            Rinds[lo] = raw
-        self._longest = max((len(_) for _ in raws), default=0)
+        for i, ind in enumerate(Linds):
+            Rinds[ind] = i
+        placed = self._placed
         for i in range(len(lowers), len(labels)):
-            labels[i].grid_forget()
+            if placed[i] is not None:
+                labels[i].grid_forget()
+                placed[i] = None
         self.event_generate('<Configure>')
 
 
     def configure(self, *args, **kwargs):
         """Configure widget settings. choices can also be set here."""
-        #TODO: support changing fonts/bg/fg
         choices = kwargs.pop('choices', None)
         style = kwargs.pop('labelstyle', None)
         ret = tk.Frame.configure(self, *args, **kwargs)
         if choices is not None:
             self._prep_choices(choices)
         if style is not None:
-            for keyp, selp in zip(('', '_un'), ('active', '_')):
-                d = getattr(self, selp + 'selected')
-                for keysuffix in 'bg', 'fg':
-                    key = keyp + keysuffix
-                    d[key] = style.pop(key, d[key])
+            for prefix, d in (
+                    ('active', self._selected), ('', self._unselected)):
+                for short, key in (('bg', 'background'), ('fg', 'foreground')):
+                    d[key] = style.get(prefix + short, d[key])
+            self._update_argv()
             self.frame.configure(background=self._unselected['background'])
             if 'font' in style:
                 self._labelstyle['font'] = style['font']
+            call = self.tk.call
+            painted = self._painted
+            for i, lbl in enumerate(self._data[_LABEL]):
+                if 'font' in style:
+                    lbl.configure(font=style['font'])
+                if i in painted:
+                    call(lbl._w, 'configure', *self._selected_argv)
+                else:
+                    call(lbl._w, 'configure', *self._unselected_argv)
         return ret
 
 
@@ -162,33 +229,80 @@ class ItemSelector(Scrollframe):
         nitems = len(raws)
         if not nitems:
             return []
-        if exact or val.lower() != val:
+        # islower() avoids copying val for the common lowercase query.
+        if exact or (not val.islower() and val.lower() != val):
             if exact:
                 stop = bisect.bisect_right(raws, val)
+                start = bisect.bisect_left(raws, val, hi=stop)
             else:
-                stop = bisect.bisect_left(raws, self._next_prefix(val))
-            start = bisect.bisect_left(raws, val, hi=stop)
+                start, stop = self._prefix_range(raws, val, self._ranges[1])
             inds = sorted((Linds[i], i) for i in range(start, stop))
         else:
-            txt = lows
-            stop = bisect.bisect_left(lows, self._next_prefix(val))
-            start = bisect.bisect_left(lows, val, hi=stop)
+            start, stop = self._prefix_range(lows, val, self._ranges[0])
             inds = [(i, Rinds[i]) for i in range(start, stop)]
-            Linds = idind
-        for i in range(start):
-            labels[Linds[i]].configure(**self._unselected)
-        for i in range(stop, nitems):
-            labels[Linds[i]].configure(**self._unselected)
-        ret = []
-        for (L, R) in inds:
-            ret.append(raws[R])
-            labels[L].configure(**self._selected)
+        ret = [raws[R] for L, R in inds]
         if inds:
             self.snap(labels[inds[0][0]], 'x')
         else:
             self.snap(labels[min(start, nitems - 1)], 'x')
+        # Only repaint labels whose selection changed.
+        self._cancel_repaint()
+        selected = set([L for L, R in inds])
+        painted = self._painted
+        unpaint = painted - selected
+        paint = selected - painted
+        if len(unpaint) + len(paint) > self._SYNC_REPAINT:
+            # Repaint the columns in view now and the rest when idle.
+            rows = max(self.winfo_height() // self.lineheight(), 1)
+            ncols = -(-nitems // rows)
+            left, right = self.xview()
+            lo = (int(left * ncols) - 1) * rows
+            hi = (int(right * ncols) + 2) * rows
+            later = (
+                set([L for L in unpaint if not lo <= L < hi]),
+                set([L for L in paint if not lo <= L < hi]))
+            unpaint -= later[0]
+            paint -= later[1]
+            if later[0] or later[1]:
+                self._idle = self.after_idle(self._finish_repaint, *later)
+        self._repaint(unpaint, paint)
         return ret
 
+    # Number of label changes above which offscreen ones are deferred.
+    _SYNC_REPAINT = 64
+
+    def _repaint(self, unpaint, paint):
+        """Recolor labels and record them in _painted."""
+        labels = self._data[_LABEL]
+        call = self.tk.call
+        argv = self._unselected_argv
+        for L in unpaint:
+            call(labels[L]._w, 'configure', *argv)
+        argv = self._selected_argv
+        for L in paint:
+            call(labels[L]._w, 'configure', *argv)
+        self._painted.difference_update(unpaint)
+        self._painted.update(paint)
+
+    def _finish_repaint(self, unpaint, paint):
+        """Run a repaint deferred by select()."""
+        self._idle = None
+        self._repaint(unpaint, paint)
+
+    def _cancel_repaint(self):
+        """Cancel a deferred repaint, if any.
+
+        _painted only holds labels actually painted so the next
+        select() will pick up whatever was left undone.
+        """
+        if self._idle is not None:
+            self.after_cancel(self._idle)
+            self._idle = None
+
+    @staticmethod
+    def _destroyed(ev):
+        ev.widget._cancel_repaint()
+
     def lineheight(self):
         """Pixel height of a single row."""
         #+2 for border of 1 on all sides.
@@ -200,9 +314,14 @@ class ItemSelector(Scrollframe):
         H = self.winfo_height()
         rows = max(H // self.lineheight(), 1)
         labels = self._data[_LABEL]
+        placed = self._placed
         for i in range(len(self._data[0])):
-            col, row = divmod(i, rows)
-            labels[i].grid(row=row, column=col, sticky='nsew', padx=(0,10))
+            pos = divmod(i, rows)
+            if placed[i] != pos:
+                placed[i] = pos
+                col, row = pos
+                labels[i].grid(
+                    row=row, column=col, sticky='nsew', padx=(0,10))
 
 class ItemEntry(EmacsEntry):
     """Entry-like widget for controlling an ItemSelector."""
@@ -215,28 +334,31 @@ class ItemEntry(EmacsEntry):
         selector = kwargs.pop('selector')
         EmacsEntry.__init__(self, *args, **kwargs)
         subclass(self, ItemEntry)
+        # Return flushes before instance bindings see stale candidates.
+        subclass(self, self._FLUSH_TAG, before=str(self))
         self._selector = selector
         self._cycling = False
-        self._ind = -1
-        current = self.get('1.0', 'end - 1 chars')
-        self._candidates = self._selector.select(current)
-        self._candidates.append(current)
-        self._prefix = True
+        self._pending = None
+        self._refresh()
 
+        if not self.bind_class(self._FLUSH_TAG):
+            class_bind(
+                self, self._FLUSH_TAG, Return=lambda e: e.widget._flush())
         if not self.bind_class('ItemEntry'):
             def _vcb_Modified(e):
                 self = e.widget
                 if self._cycling:
                     self._cycling = False
-                else:
-                    current = self.get('1.0', 'end - 1 chars')
-                    candidates = self._selector.select(current)
-                    candidates.append(current)
-                    self._candidates = candidates
-                    self._ind = -1
-                    self._prefix = True
+                elif self._pending is None:
+                    self._pending = self.after(self._DELAY, self._refresh)
+            def _cb_Destroy(e):
+                self = e.widget
+                if self._pending is not None:
+                    self.after_cancel(self._pending)
+                    self._pending = None
             def _cb_Escape(e):
                 self = e.widget
+                self._flush()
                 if self.tag_ranges('sel'):
                     self._cycling = True
                     self.delete('1.0', 'end')
@@ -247,23 +369,9 @@ class ItemEntry(EmacsEntry):
             def tabcb(direction):
                 def tab(e):
                     self = e.widget
+                    self._flush()
                     if self._prefix:
-                        prefix = []
-                        lowered = False
-                        for chars in zip(*self._candidates[:-1]):
-                            if len(set(chars)) == 1:
-                                if lowered:
-                                    prefix.append(chars[0].lower())
-                                else:
-                                    prefix.append(chars[0])
-                            else:
-                                check = set(''.join(chars).lower())
-                                if len(check) == 1:
-                                    lowered = True
-                                    prefix.append(check.pop())
-                                else:
-                                    break
-                        result = ''.join(prefix)
+                        result = self._common_prefix(self._candidates[:-1])
                         if result:
                             self._candidates[-1] = result
                             self._cycling = True
@@ -287,6 +395,50 @@ class ItemEntry(EmacsEntry):
             _cb_Shift_Tab = tabcb(-1)
             class_bind(self, ItemEntry, local_callbacks(locals()))
 
+    # Delay (ms) to batch modifications before updating the selector.
+    _DELAY = 30
+    _FLUSH_TAG = 'ItemEntryFlush'
+
+    @staticmethod
+    def _common_prefix(candidates):
+        """Return the common prefix of candidates.
+
+        candidates are in case-insensitive sorted order.  The prefix is
+        case-insensitive and lowercased from the first position that
+        differs only by case.  Only the extremes are compared: the first
+        and last candidates bound the case-insensitive prefix and
+        min()/max() bound the exact one.
+        """
+        if not candidates:
+            return ''
+        first = candidates[0]
+        last = candidates[-1]
+        stop = min(len(first), len(last))
+        i = 0
+        while i < stop and first[i].lower() == last[i].lower():
+            i += 1
+        lo = min(candidates)
+        hi = max(candidates)
+        k = 0
+        while k < i and lo[k] == hi[k]:
+            k += 1
+        return first[:k] + first[k:i].lower()
+    def _refresh(self):
+        """Select candidates matching the current text."""
+        self._pending = None
+        current = self.get('1.0', 'end - 1 chars')
+        candidates = self._selector.select(current)
+        candidates.append(current)
+        self._candidates = candidates
+        self._ind = -1
+        self._prefix = True
+
+    def _flush(self):
+        """Refresh now if a refresh is pending."""
+        if self._pending is not None:
+            self.after_cancel(self._pending)
+            self._refresh()
+
 if __name__ == '__main__':
     import argparse
     from .emacsentry import EmacsEntry
@@ -2,7 +2,6 @@ from __future__ import print_function
 __all__ = []
 
 import sys
-import traceback
 
 if sys.version_info.major > 2:
     import tkinter as tk
@@ -18,17 +17,37 @@ class HiddenScrollbar(tk.Scrollbar):
     def __init__(self, *args, **kwargs):
         tk.Scrollbar.__init__(self, *args, **kwargs)
         subclass(self, HiddenScrollbar)
-        self._ref = None
+        self._hidden = False
+        self._box = None
         self.lifted = False
 
         if not self.bind_class(HiddenScrollbar.__name__):
             def hide(e):
                 e.widget.lower()
-                e.widget._ref = e.widget.bind('<Motion>', reshow)
+                e.widget._hidden = True
             def reshow(e):
-                unbind(e.widget, '<Motion>', e.widget._ref)
-                e.widget.lift()
+                if e.widget._hidden:
+                    e.widget._hidden = False
+                    e.widget.lift()
+            def invalidate(e):
+                e.widget._box = None
             self.bind_class(HiddenScrollbar.__name__, '<Leave>', hide)
+            self.bind_class(HiddenScrollbar.__name__, '<Motion>', reshow)
+            self.bind_class(HiddenScrollbar.__name__, '<Configure>', invalidate)
+
+    def _rootbox(self):
+        """Return (x0, y0, x1, y1) in root coordinates.
+
+        The box is cached until the scrollbar is reconfigured or
+        the cache is otherwise reset by setting _box to None.
+        """
+        box = self._box
+        if box is None:
+            x = self.winfo_rootx()
+            y = self.winfo_rooty()
+            box = self._box = (
+                x, y, x + self.winfo_width(), y + self.winfo_height())
+        return box
 
     def lift(self, *args):
         tk.Scrollbar.lift(self, *args)
@@ -74,6 +93,9 @@ class Scrollframe(tk.Frame):
         self._itemind = self._canv.create_window(
             (0,0), anchor='nw', window=self._minsize)
         self.frame = tk.Frame(self._minsize, border=0)
+        subclass(self.frame, 'ScrollframeFrame')
+        # (width, height) from the frame's last <Configure>
+        self.frame._size = None
         self.frame.grid(row=0, column=0, sticky='nsew')
 
         self._showref = None
@@ -89,6 +111,9 @@ class Scrollframe(tk.Frame):
                 canv = e.widget.nametowidget(e.widget.winfo_parent())
                 self = canv.nametowidget(canv.winfo_parent())
                 canv.configure(scrollregion=canv.bbox(self._itemind))
+            def sync_framesize(e):
+                """Record the frame size for snap()."""
+                e.widget._size = (e.width, e.height)
 
             def entered(e):
                 """Start tracking mouse when enter scrollframe.
@@ -97,6 +122,8 @@ class Scrollframe(tk.Frame):
                 be shown.
                 """
                 w = e.widget.nametowidget(e.widget.winfo_parent())
+                # The toplevel may have moved since the last visit.
+                w._xscroll._box = w._yscroll._box = None
                 if w._showx or w._showy:
                     top = w.winfo_toplevel()
                     w._showref = w.bind_class(top, '<Motion>', w._show, add='+')
@@ -128,6 +155,7 @@ class Scrollframe(tk.Frame):
                 self, 'ScrollframeCanvas',
                 dict(Enter=entered, Leave=leave, Configure=sync_size))
             self.bind_class('ScrollframeMinsize', '<Configure>', sync_region)
+            self.bind_class('ScrollframeFrame', '<Configure>', sync_framesize)
         self.xview = self._canv.xview
         self.yview = self._canv.yview
 
@@ -137,21 +165,19 @@ class Scrollframe(tk.Frame):
         ex = ev.x_root
         ey = ev.y_root
         xscroll = self._xscroll
-        if self._showx and xscroll.get() != (0.0, 1.0):
-            x = xscroll.winfo_rootx()
-            y = xscroll.winfo_rooty()
-            w = xscroll.winfo_width()
-            h = xscroll.winfo_height()
-            if ((x < ex < x+w) and (y < ey < y+h)):
+        if self._showx:
+            x0, y0, x1, y1 = xscroll._rootbox()
+            if (
+                    x0 < ex < x1 and y0 < ey < y1
+                    and xscroll.get() != (0.0, 1.0)):
                 xscroll.lift()
                 return
         yscroll = self._yscroll
-        if self._showy and yscroll.get() != (0.0, 1.0):
-            x = yscroll.winfo_rootx()
-            y = yscroll.winfo_rooty()
-            w = yscroll.winfo_width()
-            h = yscroll.winfo_height()
-            if ((x < ex < x+w) and (y < ey < y+h)):
+        if self._showy:
+            x0, y0, x1, y1 = yscroll._rootbox()
+            if (
+                    x0 < ex < x1 and y0 < ey < y1
+                    and yscroll.get() != (0.0, 1.0)):
                 yscroll.lift()
                 return
         # Need this because if move mouse too fast, may lift the
@@ -186,19 +212,29 @@ class Scrollframe(tk.Frame):
         method: 'x' | 'y' | 'xy'
             scroll to the widget's x/y value if x/y in method
         """
+        frame = self.frame
+        size = frame._size
+        if size is None:
+            size = (frame.winfo_width(), frame.winfo_height())
+        # Direct children can use their parent-relative position.
+        direct = widget.master is frame
         if 'x' in method:
-            w = float(self.frame.winfo_width())
-            if w:
-                x = (widget.winfo_rootx() - self.frame.winfo_rootx()) / w
-            else:
+            w = float(size[0])
+            if not w:
                 x = 0
+            elif direct:
+                x = widget.winfo_x() / w
+            else:
+                x = (widget.winfo_rootx() - frame.winfo_rootx()) / w
             self.xview(tk.MOVETO, max(min(x, 1), 0))
         if 'y' in method:
-            h = float(self.frame.winfo_height())
-            if h:
-                y = (widget.winfo_rooty() - self.frame.winfo_rooty()) / h
-            else:
+            h = float(size[1])
+            if not h:
                 y = 0
+            elif direct:
+                y = widget.winfo_y() / h
+            else:
+                y = (widget.winfo_rooty() - frame.winfo_rooty()) / h
             self.yview(tk.MOVETO, max(min(y, 1),0))
 
 if __name__ == '__main__':
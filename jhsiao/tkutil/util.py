@@ -24,43 +24,133 @@ from __future__ import print_function
 __all__ = []
 
 from functools import wraps, partial
-import re
 import sys
 import inspect
-import traceback
-from itertools import chain
+import re
+import threading
+import time
+import weakref
 
 
 if sys.version_info.major > 2:
     import tkinter as tk
-    def argnames(func):
-        """Return a list of names of args."""
+    from sys import intern as _intern
+    def _argnames(func):
+        """Return a tuple of names of args."""
         return tuple(inspect.signature(func).parameters)
 else:
     import Tkinter as tk
     from itertools import imap as map
     from itertools import izip as zip
     from itertools import ifilter as filter
-    def argnames(func):
-        """Return a list of names of args."""
+    def _intern(s):
+        """intern() only takes str in python2."""
+        return intern(s) if type(s) is str else s
+    def _argnames(func):
+        """Return a tuple of names of args."""
         try:
-            offset = int(inspect.ismethod(func))
+            return tuple(inspect.getargspec(func).args)
         except Exception:
-            offset = 0
+            return tuple(inspect.getargspec(func.__call__).args)
+
+_VARFLAGS = inspect.CO_VARARGS | inspect.CO_VARKEYWORDS
+_ARGNAMES = weakref.WeakKeyDictionary()
+def argnames(func):
+    """Return a tuple of names of args.
+
+    The names are cached on the function as _tkutil_argnames (with
+    id(func) since functools.wraps copies __dict__) so repeated
+    bindings do not need to inspect it again.  Callables
+    without a __dict__ are cached by weakref instead.  Methods use
+    the cache of the underlying function, skipping the first arg.
+    Plain functions read the names directly from __code__.
+    """
+    if inspect.ismethod(func):
+        return argnames(func.__func__)[1:]
+    try:
+        cached = func.__dict__['_tkutil_argnames']
+        if cached[0] == id(func):
+            return cached[1]
+    except KeyError:
+        pass
+    except AttributeError:
         try:
-            ret = inspect.getargspec(func).args
-        except Exception:
-            ret = inspect.getargspec(func.__call__).args
-        return ret[offset:]
+            return _ARGNAMES[func]
+        except (KeyError, TypeError):
+            pass
+    code = getattr(func, '__code__', None)
+    if (
+        code is not None
+        and not code.co_flags & _VARFLAGS
+        and not hasattr(func, '__wrapped__')):
+        names = code.co_varnames[
+            :code.co_argcount + getattr(code, 'co_kwonlyargcount', 0)]
+    else:
+        names = _argnames(func)
+    try:
+        func._tkutil_argnames = (id(func), names)
+    except AttributeError:
+        try:
+            _ARGNAMES[func] = names
+        except TypeError:
+            pass
+    return names
+
+_EXC_INTERVAL = 0.1
+_clock = getattr(time, 'monotonic', time.time)
+class _ExcPrinter(object):
+    """traceback.print_exc(), but rate limited.
+
+    Callbacks for high-rate events (<Motion>, etc) may raise on every
+    event.  Each wrapper (and converter) has its own _ExcPrinter so
+    unrelated callbacks do not hide each other's tracebacks.
+    Tracebacks within _EXC_INTERVAL seconds of the last printed one are
+    only counted.  The count is printed by a timer at the end of the
+    interval so it is not lost if no further error comes.
+    """
+    __slots__ = ('last', 'suppressed', 'timer', 'lock')
+    def __init__(self):
+        self.last = float('-inf')
+        self.suppressed = 0
+        self.timer = None
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        now = _clock()
+        with self.lock:
+            if now - self.last < _EXC_INTERVAL:
+                self.suppressed += 1
+                if self.timer is None:
+                    self.timer = threading.Timer(
+                        self.last + _EXC_INTERVAL - now, self.report)
+                    self.timer.daemon = True
+                    self.timer.start()
+                return
+            self.last = now
+        # traceback is only needed once something fails.
+        import traceback
+        traceback.print_exc()
+
+    def report(self):
+        """Print the number of suppressed tracebacks, if any."""
+        with self.lock:
+            count = self.suppressed
+            self.suppressed = 0
+            self.timer = None
+        if count:
+            print(
+                '({} more tracebacks suppressed)'.format(count),
+                file=sys.stderr)
 
 from ..exports import PublicScope
 from ..utils.strutils import splitlines
-from ..utils.chainmap import ChainMap
 
+_FUNCIDS = {}
 with PublicScope(state=globals()):
     def callback_funcid(func):
         """Return a string to be used as the Tcl command name.
 
+        ids are formatted in hex to keep the name (and scripts) short.
         instance methods:
             id of bound method with function name
         class methods:
@@ -71,34 +161,77 @@ with PublicScope(state=globals()):
             id of func with a __name__ (
                 tries func.__name__, func.__func__.__name__,
                 func.func.__name__, and finally type(func).__name__)
+            The result is cached on func as _tkutil_funcid (with id(func)
+            so copies made by functools.wraps are ignored) if possible,
+            otherwise by id() while func is alive.
         """
         if inspect.ismethod(func):
             if isinstance(func.__self__, type):
                 # class method
-                return ''.join((
-                    repr(id(func.__func__)),
-                    repr(id(func.__self__)),
-                    func.__name__))
+                return '{:x}{:x}{}'.format(
+                    id(func.__func__), id(func.__self__), func.__name__)
             else:
                 # instance method
-                return repr(id(func))+func.__name__
+                return '{:x}{}'.format(id(func), func.__name__)
         else:
+            attrs = getattr(func, '__dict__', None)
+            if attrs is not None:
+                # Stored with id(func): functools.wraps copies __dict__
+                # so a wrapper can carry the wrapped func's entry.
+                cached = attrs.get('_tkutil_funcid')
+                if cached is not None and cached[0] == id(func):
+                    return cached[1]
+            else:
+                cached = _FUNCIDS.get(id(func))
+                if cached is not None:
+                    return cached[1]
+            name = (
+                getattr(func, '__name__', None)
+                or getattr(getattr(func, '__func__', None), '__name__', None)
+                # a partial?
+                or getattr(getattr(func, 'func', None), '__name__', None)
+                or type(func).__name__)
+            funcid = '{:x}{}'.format(id(func), name)
             try:
-                name = func.__name__
+                func._tkutil_funcid = (id(func), funcid)
             except AttributeError:
+                key = id(func)
                 try:
-                    name = func.__func__.__name__
-                except AttributeError:
-                    try:
-                        # a partial?
-                        name = func.func.__name__
-                    except AttributeError:
-                        name = type(func).__name__
-            return repr(id(func)) + name
+                    _FUNCIDS[key] = (
+                        weakref.ref(func, lambda r: _FUNCIDS.pop(key, None)),
+                        funcid)
+                except TypeError:
+                    pass
+            return funcid
+
+    def _tcl_commands(widget):
+        """Return the set of existing Tcl command names.
+
+        One 'info commands' call for checking many funcids.  The set
+        is a snapshot and only valid while no commands are deleted.
+        """
+        return set(widget.tk.splitlist(widget.tk.call('info', 'commands')))
+
+    # Characters that end a Tcl word (or start a command substitution).
+    _TCL_WORDS = re.compile(r'[\s\[\]";{}]+')
 
     # Sample line from a single bind call:
     # if {"[2235275164928callback %# %b %f %h %k %s %t %w %x %y %A %E %K %N %W %T %X %Y %D] == "break"} break\n\n
-    _FUNCID_PATTERN = re.compile(r'\[(?P<funcid>\S+)')
+    def _line_funcid(line):
+        """Return the funcid called by a binding script line.
+
+        This is the first word of the first '"[' command substitution
+        (the form tkinter and Subber generate, which may be nested in a
+        guard such as emacsentry's <<Modified>>) or else of the first
+        '['.  None if there is no such text.
+        """
+        i = line.find('"[') + 2
+        if i < 2:
+            i = line.find('[') + 1
+            if not i:
+                return None
+        return _TCL_WORDS.split(line[i:], 1)[0] or None
+
     def unbind(widget, evseq, funcids=(), tag=None, delete=True):
         """Unbind specified callbacks.
 
@@ -129,36 +262,37 @@ with PublicScope(state=globals()):
             if isinstance(funcids, str):
                 funcids = (funcids,)
             targets = set(funcids)
-            for line in filter(None, info):
-                try:
-                    fid = _FUNCID_PATTERN.search(line).group('funcid')
+            for line in info:
+                if line:
+                    fid = _line_funcid(line)
                     if fid in targets:
                         todelete.append(fid)
                     else:
                         keep.append(line)
-                except Exception:
-                    keep.append(line)
         else:
-            for line in filter(None, info):
-                try:
-                    todelete.append(
-                        _FUNCID_PATTERN.search(line).group('funcid'))
-                except Exception:
-                    pass
+            # Empty lines have no funcid.
+            todelete = [fid for fid in map(_line_funcid, info) if fid]
         if keep:
             widget.bind_class(tag, evseq, '\n\n'.join(keep)+'\n')
         else:
             widget.bind_class(tag, evseq, '')
-        if delete:
-            otherinfo = [
-                widget.bind_class(tag, seq)
-                for seq in widget.bind_class(tag)]
-            for funcid in todelete:
-                if all(funcid not in oinfo for oinfo in otherinfo):
-                    try:
-                        widget.deletecommand(funcid)
-                    except Exception:
-                        pass
+        if delete and todelete:
+            # Drop funcids that are words of the remaining scripts.
+            # evseq's script is keep, no need to fetch it.  Stop
+            # fetching once every funcid is known to be used.
+            unused = set(todelete)
+            unused.difference_update(_TCL_WORDS.split('\n'.join(keep)))
+            for seq in widget.bind_class(tag):
+                if not unused:
+                    break
+                if seq != evseq:
+                    unused.difference_update(
+                        _TCL_WORDS.split(widget.bind_class(tag, seq)))
+            for funcid in unused:
+                try:
+                    widget.deletecommand(funcid)
+                except Exception:
+                    pass
 
 
     def subclass(widget, tag=None, after=None, before=None):
@@ -178,20 +312,98 @@ with PublicScope(state=globals()):
         """
         if tag is None:
             tag = type(widget).__name__
-        tags = list(widget.bindtags())
+        tags = tuple(widget.bindtags())
         if before:
             idx = tags.index(before)
         else:
             if after is None:
                 after = str(widget)
-            idx = tags.index(str(widget))+1
-        tags.insert(idx, tag)
-        widget.bindtags(tuple(tags))
+            idx = tags.index(after)+1
+        widget.bindtags(tags[:idx] + (tag,) + tags[idx:])
+
 
+    class _EvType(object):
+        """Base class of the EvTypes.<Name> event type classes.
+
+        Each event type is a subclass with class attributes num, name
+        and aliases.  Instances are equal to the type, its instances,
+        its name, its number as a str, and its short name (e.g. 'Key'
+        for 'KeyPress') if any.
+        """
+        __slots__ = ()
+        def __eq__(self, t):
+            cls = type(self)
+            if t is cls or isinstance(t, cls):
+                return True
+            try:
+                return t in cls.aliases
+            except TypeError:
+                return False
+        def __ne__(self, t):
+            return not self == t
+        __hash__ = None
+        def __repr__(self):
+            return 'EvTypes.' + self.name
+
+    class EvTypes(object):
+        """Tkinter Event types.
+
+        Each type is a class, e.g. EvTypes.KeyPress (alias Key).  Its
+        instances compare equal to a str (event num or name), the class
+        or its instances.  mapping maps the num str to a shared instance.
+        Calling an EvTypes instance converts a %T num to that instance
+        (KeyError if unknown).
+        num to class mapping:
+            2: KeyPress
+            3: KeyRelease
+            4: ButtonPress
+            5: ButtonRelease
+            6: Motion
+            7: Enter
+            8: Leave
+            9: FocusIn
+            10: FocusOut
+            11: Keymap
+            12: Expose
+            13: GraphicsExpose
+            14: NoExpose
+            15: Visibility
+            16: Create
+            17: Destroy
+            18: Unmap
+            19: Map
+            20: MapRequest
+            21: Reparent
+            22: Configure
+            23: ConfigureRequest
+            24: Gravity
+            25: ResizeRequest
+            26: Circulate
+            27: CirculateRequest
+            28: Property
+            29: SelectionClear
+            30: SelectionRequest
+            31: Selection
+            32: Colormap
+            33: ClientMessage
+            34: Mapping
+            35: VirtualEvent
+            36: Activate
+            37: Deactivate
+            38: MouseWheel
+        """
+        __slots__ = ()
+        mapping = {}
+        def __call__(self, name):
+            num = int(name)
+            table = self.table
+            tp = table[num] if 0 <= num < len(table) else None
+            if tp is None:
+                raise KeyError(name)
+            return tp
 
     def _make_types():
-        """Generate EvTypes class."""
-        lines = ['class EvTypes(object):']
+        """Fill in EvTypes."""
         types = {
             '2': 'KeyPress',
             '3': 'KeyRelease',
@@ -230,71 +442,91 @@ with PublicScope(state=globals()):
             '36': 'Activate',
             '37': 'Deactivate',
             '38': 'MouseWheel'}
-        lines.append('"""Tkinter Event types.')
-        lines.append('')
-        lines.append('compare with a str (event num or name), or the class')
-        lines.append('num to class mapping:')
-        for num, cls in types.items():
-            lines.append('    {}: {}'.format(num, cls))
-        lines.append('"""')
-        for num, cls in types.items():
-            lines.extend((
-                'class {}(object):'.format(cls),
-                '    def __eq__(self, t):'))
-            if cls.endswith('Press'):
-                short = cls[:-len('Press')]
-                lines.append((
-                    '        return t is EvTypes.{cls}'
-                    ' or isinstance(t, EvTypes.{cls})'
-                    ' or t == "{cls}" or t == "{num}"'
-                    ' or t == "{short}"').format(
-                        cls=cls, num=num, short=short))
-                lines.append('{} = {}'.format(short, cls))
-            else:
-                lines.append((
-                    '        return t is EvTypes.{cls} '
-                    ' or isinstance(t, EvTypes.{cls}) or t == "{cls}"'
-                    ' or t == "{num}"').format(cls=cls, num=num))
-        mapping = ['mapping = {']
-        mapping.extend("'{}': {},".format(k, v) for k, v in types.items())
-        mapping.append('}')
-        lines.append(''.join(mapping))
-        lines.extend((
-            'def __call__(self, name):',
-            '    return self.mapping[name]()'))
-        return '\n    '.join(lines)
-    exec(_make_types(), globals())
+        for num, name in types.items():
+            aliases = [name, num]
+            short = None
+            if name.endswith('Press'):
+                short = name[:-len('Press')]
+                aliases.append(short)
+            cls = type(name, (_EvType,), dict(
+                __slots__=(), num=int(num), name=name,
+                aliases=frozenset(aliases)))
+            setattr(EvTypes, name, cls)
+            if short:
+                setattr(EvTypes, short, cls)
+            EvTypes.mapping[num] = cls()
+        # Event type numbers are small ints, index a tuple instead of
+        # hashing the str into mapping.  Instances are shared by all
+        # events.
+        EvTypes.table = tuple([
+            EvTypes.mapping.get(str(i))
+            for i in range(max(map(int, types))+1)])
+    _make_types()
     del _make_types
 
     class EvState(object):
         """tcl state bitflag checker."""
-        bits = dict(
-            Shift = 1<<0,
-            Caps_Lock = 1<<1,
-            Control = 1<<2,
-            Mod1 = 1<<3, # numlock
-            Mod2 = 1<<4,
-            Mod3 = 1<<5, # scrolllock
-            Mod4 = 1<<6,
-            Mod5 = 1<<7,
-            B1 = 1<<8,
-            B2 = 1<<9,
-            B3 = 1<<10,
-            B4 = 1<<11,
-            B5 = 1<<12,
-            Alt = 1<<17)
+        bits = (
+            ('Shift', 1<<0),
+            ('Caps_Lock', 1<<1),
+            ('Control', 1<<2),
+            ('Mod1', 1<<3), # numlock
+            ('Mod2', 1<<4),
+            ('Mod3', 1<<5), # scrolllock
+            ('Mod4', 1<<6),
+            ('Mod5', 1<<7),
+            ('B1', 1<<8),
+            ('B2', 1<<9),
+            ('B3', 1<<10),
+            ('B4', 1<<11),
+            ('B5', 1<<12),
+            ('Alt', 1<<17))
+        # Union of all bits, state & _all_mask tests if any is set.
+        _all_mask = sum([bit for name, bit in bits])
+        __slots__ = ('state',)
         def __init__(self, state):
             self.state = int(state)
         def __repr__(self):
+            state = self.state
+            if not state & EvState._all_mask:
+                return 'EvState: '
             return 'EvState: ' + ' | '.join(
-                k for k, b in self.bits.items()
-                if self.state&b)
+                [k for k, b in EvState.bits if state & b])
 
-        def __getattr__(self, name):
-            result = self.bits[name] & self.state
-            setattr(self, name, result)
-            return result
+    def _flag(bit):
+        """Return a property testing bit of EvState.state."""
+        return property(lambda self: self.state & bit)
+    # Flags are only computed when they are read.
+    for _name, _bit in EvState.bits:
+        setattr(EvState, _name, _flag(_bit))
+    del _name, _bit, _flag
+
+
+    class _Subs(dict):
+        """Substitution overrides of a Subber instance.
 
+        Tables computed from these subs are cached in tables.
+        Modifying the subs clears tables and increments gen so caches
+        elsewhere can tell their entries are stale.
+        """
+        __slots__ = ('tables', 'gen', '__weakref__')
+        def __init__(self, *args, **kwargs):
+            dict.__init__(self, *args, **kwargs)
+            self.tables = {}
+            self.gen = 0
+
+    def _invalidating(method):
+        """Wrap a dict method to invalidate the _Subs caches first."""
+        def invalidating(self, *args, **kwargs):
+            self.tables.clear()
+            self.gen += 1
+            return method(self, *args, **kwargs)
+        return invalidating
+    for _name in (
+            '__setitem__', '__delitem__', 'clear', 'pop', 'popitem',
+            'setdefault', 'update'):
+        setattr(_Subs, _name, _invalidating(getattr(dict, _name)))
+    del _name, _invalidating
 
     class Subber(object):
         """Base class for handling substitution tcl commands.
@@ -318,11 +550,46 @@ with PublicScope(state=globals()):
             """
             self.names = subnames
             csubs = type(self).subs
-            for k, v in subs:
-                if isinstance(v, str):
-                    subs[k] = (v, csubs.get(k, (None,None))[1])
-            self.subs = subs
+            self.subs = _Subs([
+                (k, (v, csubs.get(k, (None,None))[1]))
+                if isinstance(v, str) else (k, v)
+                for k, v in subs.items()])
+
 
+        _tables = {}
+        @classmethod
+        def _table(cls, subnames, subs=None):
+            """Return the substitutions and converters for subnames.
+
+            Converters for 'widget' are left as given (usually None) for
+            info() to fill in.  If subs is not given, the result only
+            depends on the class and subnames so it is cached.  Subber
+            instance subs also carry their own cache.
+            """
+            cache = getattr(subs, 'tables', None) if subs else Subber._tables
+            if cache is not None:
+                key = (cls, tuple(subnames))
+                table = cache.get(key)
+                if table is not None:
+                    return table
+            items = []
+            base = cls.subs
+            for k in subnames:
+                item = subs.get(k) if subs else None
+                if item is None:
+                    item = base.get(k)
+                    if item is None:
+                        items.append((k, None))
+                        continue
+                elif not isinstance(item, (list, tuple)):
+                    item = (item, base.get(k, (None,None))[1])
+                if not isinstance(item[0], str):
+                    item = (str(item[0]), item[1])
+                items.append(tuple(item))
+            table = tuple(zip(*items)) or ((),())
+            if cache is not None:
+                cache[key] = table
+            return table
 
         @classmethod
         def info(cls, widget, subnames, subs=None):
@@ -332,37 +599,55 @@ with PublicScope(state=globals()):
             the form '%X' where X is some char.  Converters convert the
             corresponding Tcl return value from str to an appropriate
             type.  Special handling for subname 'widget' which requires
-            <widget>'s nametowidget method
+            <widget>'s nametowidget method.  The root is only looked up
+            if 'widget' is needed and the result is then cached on the
+            root unless subs is a plain dict.  Entries for subs are
+            dropped when subs is collected and ignored once it is
+            modified.
             """
+            table = cls._table(subnames, subs)
+            if 'widget' not in subnames:
+                return table
+            cache = None
             if widget is None:
                 nametowidget = None
             else:
-                master = widget.master
-                while master is not None:
-                    widget = master
-                    master = widget.master
-                nametowidget = widget.nametowidget
-            items = []
-            subs = ChainMap(subs, cls.subs) if subs else cls.subs
-            for k in subnames:
-                item = subs.get(k)
-                if item is None:
-                    items.append((k, None))
-                else:
-                    if not isinstance(item, (list, tuple)):
-                        item = (item, cls.subs.get(k, (None,None))[1])
-                    if k == 'widget' and item[1] is None:
-                        items.append((str(item[0]), nametowidget))
+                top = root(widget)
+                nametowidget = top.nametowidget
+                if not subs or isinstance(subs, _Subs):
+                    cache = top.__dict__.get('_tkutil_info')
+                    if cache is None:
+                        cache = top.__dict__['_tkutil_info'] = {}
+                    if subs:
+                        key = (cls, tuple(subnames), id(subs))
+                        hit = cache.get(key)
+                        if (
+                            hit is not None and hit[0]() is subs
+                            and hit[1] == subs.gen):
+                            return hit[2]
                     else:
-                        if not isinstance(item[0], str):
-                            item = (str(item[0]), item[1])
-                        items.append(item)
-            return tuple(zip(*items)) or ((),())
+                        key = (cls, tuple(subnames))
+                        hit = cache.get(key)
+                        if hit is not None:
+                            return hit
+            strs, cvts = table
+            result = strs, tuple([
+                nametowidget if k == 'widget' and cvt is None else cvt
+                for k, cvt in zip(subnames, cvts)])
+            if cache is not None:
+                if subs:
+                    cache[key] = (
+                        weakref.ref(subs, lambda r: cache.pop(key, None)),
+                        subs.gen, result)
+                else:
+                    cache[key] = result
+            return result
 
         @staticmethod
-        def _cvt(item, converter):
+        def _cvt(print_exc, item, converter):
             """Try to apply a converter.
 
+            print_exc: the _ExcPrinter to report failures with.
             item: the string argument from Tcl.
             converter: a callable to convert item.
             Return '??<original_value>' on failure.
@@ -375,30 +660,75 @@ with PublicScope(state=globals()):
                 if item == '??':
                     return None
                 else:
-                    traceback.print_exc()
+                    print_exc()
                     return '??'+item
 
         @staticmethod
-        def _sub_args(cvt, cvts, *data):
-            """Apply each item in cvts to corresponding item in data.
+        def _truncate(nargs, args):
+            """Converter when no arg needs converting."""
+            return args[:nargs]
+
+        _makers = {}
+        @classmethod
+        def _converter(cls, cvts):
+            """Return a function converting a tuple of Tcl args.
+
+            The function applies _cvt with each item in cvts.  It is
+            generated once per number of args so each call is a single
+            tuple expression instead of a map() over the args.  Args
+            whose converter is None are passed through without a call,
+            so makers are cached per pattern of None converters.  If all
+            converters are None, the args are only truncated.  Like
+            map(), extra args are dropped and missing args shorten the
+            result, so the callback is still called.
+            """
+            nones = tuple([c is None for c in cvts])
+            if all(nones):
+                return partial(Subber._truncate, len(nones))
+            make = Subber._makers.get(nones)
+            if make is None:
+                nargs = len(nones)
+                cnames = ''.join(['c{}, '.format(i) for i in range(nargs)])
+                anames = ''.join(['a{}, '.format(i) for i in range(nargs)])
+                lines = [
+                    'def make(cvt, cvts):',
+                    '    {}= cvts'.format(cnames),
+                    '    def convert(args):',
+                    '        if len(args) != {}:'.format(nargs),
+                    '            return tuple([',
+                    '                a if c is None else cvt(a, c)',
+                    '                for a, c in zip(args, cvts)])',
+                    '        {}= args'.format(anames),
+                    '        return ({})'.format(''.join([
+                        ('a{0}, ' if isnone else 'cvt(a{0}, c{0}), ').format(i)
+                        for i, isnone in enumerate(nones)])),
+                    '    return convert']
+                namespace = {}
+                exec('\n'.join(lines), namespace)
+                make = Subber._makers[nones] = namespace['make']
+            return make(partial(cls._cvt, _ExcPrinter()), cvts)
+
+        @staticmethod
+        def _sub_args(convert, *data):
+            """Convert data with a _converter() function.
 
             Return tuple of results
             """
-            return map(cvt, data, cvts)
+            return convert(data)
         @staticmethod
-        def _sub_tuple(cvt, cvts, *data):
-            """Apply each item in cvts to corresponding item in data.
+        def _sub_tuple(convert, *data):
+            """Convert data with a _converter() function.
 
             Return a 1-tuple containing a tuple of results
             """
-            return (tuple(map(cvt, data, cvts)),)
+            return (convert(data),)
         @staticmethod
-        def _sub_dict(cvt, cvts, subnames, *data):
-            """Apply eahc item in cvts to corresponding item in data.
+        def _sub_dict(convert, subnames, *data):
+            """Convert data with a _converter() function.
 
             Return a dict of subname: result
             """
-            return (dict(zip(subnames, map(cvt, data, cvts))),)
+            return (dict(zip(subnames, convert(data))),)
 
         # substitution methods suitable as subst for widget.register()
         def sub_args(self, widget):
@@ -408,7 +738,7 @@ with PublicScope(state=globals()):
             takes a sequence of arguents.
             """
             subs, cvts = self.info(widget, self.names, self.subs)
-            return partial(self._sub_args, self._cvt, cvts)
+            return partial(self._sub_args, self._converter(cvts))
 
         def sub_tuple(self, widget):
             """Return parser returning a tuple.
@@ -417,7 +747,7 @@ with PublicScope(state=globals()):
             takes a single tuple of arguments.
             """
             subs, cvts = self.info(widget, self.names, self.subs)
-            return partial(self._sub_tuple, self._cvt, cvts)
+            return partial(self._sub_tuple, self._converter(cvts))
 
         def sub_dict(self, widget):
             """Return a parser returning a dict.
@@ -427,7 +757,24 @@ with PublicScope(state=globals()):
             names in self.props.
             """
             subs, cvts = self.info(widget, self.names, self.subs)
-            return partial(self._sub_dict, self._cvt, cvts, self.names)
+            return partial(
+                self._sub_dict, self._converter(cvts), self.names)
+
+        @staticmethod
+        def _wrap0(func):
+            """Wrap a func that takes no substitutions.
+
+            Any args passed by Tcl (e.g. appended by a -command option)
+            are ignored.
+            """
+            print_exc = _ExcPrinter()
+            @wraps(func)
+            def wrapped(*args):
+                try:
+                    return func()
+                except Exception:
+                    print_exc()
+            return wrapped
 
         # wrap different calling conventions, suitable for create_command
         @classmethod
@@ -441,14 +788,27 @@ with PublicScope(state=globals()):
             if subnames is None:
                 subnames = argnames(func)
             subs, cvts = cls.info(widget, subnames, subs)
-            cvt = cls._cvt
+            if not cvts:
+                return cls._wrap0(func)
+            if all([cvt is None for cvt in cvts]):
+                nargs = len(cvts)
+                print_exc = _ExcPrinter()
+                @wraps(func)
+                def wrapped(*args):
+                    try:
+                        return func(*args[:nargs])
+                    except Exception:
+                        print_exc()
+                return wrapped
 
+            convert = cls._converter(cvts)
+            print_exc = _ExcPrinter()
             @wraps(func)
             def wrapped(*args):
                 try:
-                    return func(*map(cvt, args, cvts))
+                    return func(*convert(args))
                 except Exception:
-                    traceback.print_exc()
+                    print_exc()
             return wrapped
 
         @classmethod
@@ -461,14 +821,14 @@ with PublicScope(state=globals()):
             if subnames is None:
                 subnames = argnames(func)
             subs, cvts = cls.info(widget, subnames, subs)
-            cvt = cls._cvt
-
+            convert = cls._converter(cvts)
+            print_exc = _ExcPrinter()
             @wraps(func)
             def wrapped(*args):
                 try:
-                    return func(tuple(map(cvt, args, cvts)))
+                    return func(convert(args))
                 except Exception:
-                    traceback.print_exc()
+                    print_exc()
             return wrapped
 
         @classmethod
@@ -481,14 +841,14 @@ with PublicScope(state=globals()):
             if subnames is None:
                 subnames = argnames(func)
             subs, cvts = cls.info(widget, subnames, subs)
-            cvt = cls._cvt
-
+            convert = cls._converter(cvts)
+            print_exc = _ExcPrinter()
             @wraps(func)
             def wrapped(*data):
                 try:
-                    return func(dict(zip(subnames, map(cvt, data, cvts))))
+                    return func(dict(zip(subnames, convert(data))))
                 except Exception:
-                    traceback.print_exc()
+                    print_exc()
             return wrapped
 
         @classmethod
@@ -501,14 +861,16 @@ with PublicScope(state=globals()):
             if subnames is None:
                 subnames = argnames(func)
             subs, cvts = cls.info(widget, subnames, subs)
-            cvt = cls._cvt
-
+            if not cvts:
+                return cls._wrap0(func)
+            convert = cls._converter(cvts)
+            print_exc = _ExcPrinter()
             @wraps(func)
             def wrapped(*data):
                 try:
-                    return func(**dict(zip(subnames, map(cvt, data, cvts))))
+                    return func(**dict(zip(subnames, convert(data))))
                 except Exception:
-                    traceback.print_exc()
+                    print_exc()
             return wrapped
 
         def wrap_args(self, widget, func):
@@ -524,6 +886,13 @@ with PublicScope(state=globals()):
             """wrap_kwargs_ using self.names."""
             return self.wrap_kwargs_(widget, func, self.names, self.subs)
 
+        _joined = {}
+        _patterns = {
+            (False, False): '%s\n',
+            (True, False): '+%s\n',
+            (False, True): 'if {"[%s]" == "break"} break\n',
+            (True, True): '+if {"[%s]" == "break"} break\n',
+        }
         @classmethod
         def script_(
             cls, func=None, funcid=None, subnames=None,
@@ -536,24 +905,14 @@ with PublicScope(state=globals()):
             If withbreak, then the script will be wrapped in a Tcl if
             statement to break if the command returns "break".
             """
-            subs = ChainMap(subs, cls.subs) if subs else cls.subs
-            substrs = []
-            for name in (subnames or argnames(func)):
-                thing = subs.get(name)
-                if thing is None:
-                    substrs.append(name)
-                elif isinstance(thing, (list, tuple)):
-                    substrs.append(str(thing[0]))
-                else:
-                    substrs.append(str(thing))
+            substrs = cls._table(subnames or argnames(func), subs)[0]
+            joined = Subber._joined.get(substrs)
+            if joined is None:
+                joined = Subber._joined[substrs] = ''.join(
+                    [' ' + sub for sub in substrs])
             funcid = funcid or callback_funcid(func)
-            if withbreak:
-                pattern = '{add}if {{"[{basescript}]" == "break"}} break\n'
-            else:
-                pattern = '{add}{basescript}\n'
-            return pattern.format(
-                add=('+' if add else ''),
-                basescript=' '.join(chain((funcid,), substrs)))
+            return Subber._patterns[bool(add), bool(withbreak)] % (
+                funcid + joined,)
 
         def script(self, func=None, funcid=None, add=False, withbreak=True):
             """Return a single-line tcl script usable with bind.
@@ -570,7 +929,7 @@ with PublicScope(state=globals()):
         @classmethod
         def createcommand(
             cls, widget, func, funcid=None, wrapper='args', subnames=None,
-            override=False, cleanup=False, subs=None):
+            override=False, cleanup=False, subs=None, existing=None):
             """Wrap func and create (maybe). Return (created?, funcid).
 
             If wrapper is None, use func as is.  Otherwise, default to
@@ -583,20 +942,31 @@ with PublicScope(state=globals()):
             already exists.
             If cleanup, add funcid to widget._tclCommands (internal impl
                 detail...)
+            existing: A set of existing command names (from one
+                'info commands' call when creating many commands) to
+                check instead of querying Tcl per funcid.  Created
+                funcids are added to it.
+            func is only wrapped if the command is created.
             """
-            if wrapper is None:
-                wrapped = func
-            else:
-                if not callable(wrapper):
-                    if not wrapper:
-                        wrapper = 'args'
-                    wrapper = getattr(
-                        cls, 'wrap_{}_'.format(wrapper), cls.wrap_args_)
-                wrapped = wrapper(widget, func, subnames, subs)
             funcid = funcid or callback_funcid(func)
-            if override or not widget.tk.call('info', 'commands', funcid):
+            if existing is None:
+                exists = widget.tk.call('info', 'commands', funcid)
+            else:
+                exists = funcid in existing
+            if override or not exists:
+                if wrapper is None:
+                    wrapped = func
+                else:
+                    if not callable(wrapper):
+                        if not wrapper:
+                            wrapper = 'args'
+                        wrapper = getattr(
+                            cls, 'wrap_{}_'.format(wrapper), cls.wrap_args_)
+                    wrapped = wrapper(widget, func, subnames, subs)
                 widget.tk.createcommand(funcid, wrapped)
-                if cleanup and created:
+                if existing is not None:
+                    existing.add(funcid)
+                if cleanup:
                     # This relies on a tk internal implementation...
                     if widget._tclCommands is not None:
                         widget._tclCommands.append(funcid)
@@ -609,7 +979,7 @@ with PublicScope(state=globals()):
         def make_script_(
             cls, widget, func, funcid=None, wrapper='args',
             subnames=None, override=False, add=False, withbreak=False,
-            cleanup=False, subs=None):
+            cleanup=False, subs=None, existing=None):
             """Call createcommand if needed and then call script_.
 
             Return if created and the script.
@@ -619,7 +989,7 @@ with PublicScope(state=globals()):
                 subnames = argnames(func)
             created, funcid = cls.createcommand(
                 widget, func, funcid, wrapper, subnames, override,
-                cleanup, subs)
+                cleanup, subs, existing)
             return cls.script_(func, funcid, subnames, add, withbreak, subs)
 
         def make_script(
@@ -646,6 +1016,7 @@ with PublicScope(state=globals()):
     ValSubs.__doc__ += '\n\n' + '\n'.join(splitlines(', '.join(sorted(ValSubs.subs))))
 
 
+    _EVTYPE = ('%T', EvTypes())
     class EvSubs(Subber):
         """Manage Tcl Event bindings."""
         subs= dict(
@@ -673,8 +1044,8 @@ with PublicScope(state=globals()):
             state=('%s', EvState), # state flags
             subwindow=('%S', None), # subwindow?
             time=('%t', int), # timestamp of event
-            type=('%T', EvTypes()), # type of event
-            tp=('%T', EvTypes()), # alias of type since it's a builtin
+            type=_EVTYPE, # type of event
+            tp=_EVTYPE, # alias of type since it's a builtin
             widget=('%W', None), # name of widget, requires special handling
             width=('%w', int), # width of widget
             x=('%x', int), # x within widget
@@ -683,6 +1054,7 @@ with PublicScope(state=globals()):
     EvSubs.__doc__ += '\n\n' + '\n'.join(splitlines(', '.join(sorted(EvSubs.subs))))
 
     class Validator(object):
+        __slots__ = ('wrap', '__func__', 'getter')
         def __init__(self, wrap='args'):
             self.wrap = wrap
             self.__func__ = None
@@ -700,6 +1072,7 @@ with PublicScope(state=globals()):
             return _BoundValidator(self, self.getter(inst, cls), inst)
 
     class _BoundValidator(Validator):
+        __slots__ = ('pref', 'widget')
         def __init__(self, par, func, widget):
             self.pref = par.wrap
             self.widget = widget
@@ -730,6 +1103,7 @@ with PublicScope(state=globals()):
         Use as a decorator. bind_members and bind_dict will search for
         Bindings instances.
         """
+        __slots__ = ('bindings', '__func__', 'getter', 'pref', 'attrname')
         def __init__(self, *bindings, **kwargs):
             """Initialize list of bindings.
 
@@ -737,16 +1111,27 @@ with PublicScope(state=globals()):
             kwargs:
                 wrap: ['args'|'tuple'|'dict'|'kwargs']: the wrapping
                     method to be used on the decorated function.
+            The sequences are interned since the same few are usually
+            used throughout an application.
             """
-            self.bindings = bindings
+            self.bindings = tuple([_intern(b) for b in bindings])
             self.__func__ = None
             self.getter = None
             self.pref = kwargs.get('wrap', 'args')
+            self.attrname = None
 
         def __call__(self, func):
-            """Decorate a member."""
+            """Decorate a member.
+
+            The argnames are computed now so binding does not need to
+            inspect the function.
+            """
             self.__func__ = func
             self.getter = getattr(func, '__get__', self._getter)
+            try:
+                argnames(getattr(func, '__func__', func))
+            except Exception:
+                pass
             return self
 
         def f(self, func):
@@ -758,13 +1143,45 @@ with PublicScope(state=globals()):
             """Use this if self.__func__ has no __get__."""
             return self.__func__
 
+        def __set_name__(self, owner, name):
+            """Record the attribute name (python3.6+)."""
+            self.attrname = name
+
         def __get__(self, inst, cls=None):
-            """Bind function."""
-            return _BoundBindings(self, self.getter(inst, cls), inst)
+            """Bind function.
+
+            If the attribute name is known, the result is stored on inst
+            so later lookups reuse it instead of binding again.  This
+            refers back to inst, so inst is freed by the cycle collector
+            (as tkinter widgets already are via master.children).
+            Otherwise, a new _BoundBindings is returned per access.
+            """
+            bound = _BoundBindings(self, self.getter(inst, cls), inst)
+            if inst is not None and self.attrname is not None:
+                try:
+                    inst.__dict__[self.attrname] = bound
+                except AttributeError:
+                    pass
+            return bound
+
 
+    # Tcl lambda binding a script to many sequences in one call.
+    _BIND_ALL = '{tag script args} {foreach seq $args {bind $tag $seq $script}}'
+    _BIND_PAIRS = '{tag args} {foreach {seq script} $args {bind $tag $seq $script}}'
+    def _stock_bind_class(widget):
+        """Return whether widget uses tkinter's bind_class.
+
+        Subclasses may override bind_class (e.g. to wrap callbacks) so
+        only the stock method can be replaced by a direct Tcl call.
+        """
+        func = getattr(type(widget), 'bind_class', None)
+        return getattr(func, '__func__', func) is _MISC_BIND_CLASS
+    _MISC_BIND_CLASS = getattr(
+        tk.Misc.bind_class, '__func__', tk.Misc.bind_class)
 
     class _BoundBindings(object):
         """Bound functions."""
+        __slots__ = ('bindings', 'pref', '__func__', 'widget')
         def __init__(self, obinds, func, widget):
             """Initialize _BoundBindings.
 
@@ -790,13 +1207,18 @@ with PublicScope(state=globals()):
         def bind_(
             self, bindname, widget=None, tag=None,
             funcid=None, wrapper='', subnames=None, override=False,
-            add=False, withbreak=True, cleanup=False, subs=None):
+            add=False, withbreak=True, cleanup=False, subs=None,
+            existing=None, pairs=None):
             """Highest level of control for binding.
 
             Bind to a widget for each sequence in self.bindings.
             wrapper will default to args
             valid values:
                 args, dict, kwargs, tuple
+            existing: see Subber.createcommand()
+            pairs: If a list, extend it with sequence, script for each
+                sequence instead of binding.  The caller binds them
+                (with a stock bind_class) later.
             """
             if widget is None:
                 widget = self.widget
@@ -806,10 +1228,19 @@ with PublicScope(state=globals()):
                 wrapper = self.pref
             script = EvSubs.make_script_(
                 widget, self.__func__, funcid, wrapper, subnames, override,
-                add, withbreak, cleanup, subs)
-            bindfunc = getattr(widget, bindname)
-            for binding in self.bindings:
-                bindfunc(tag, binding, script)
+                add, withbreak, cleanup, subs, existing)
+            bindings = self.bindings
+            if pairs is not None:
+                for binding in bindings:
+                    pairs.extend((binding, script))
+            elif (
+                bindname == 'bind_class' and len(bindings) > 1
+                and _stock_bind_class(widget)):
+                widget.tk.call('apply', _BIND_ALL, tag, script, *bindings)
+            else:
+                bindfunc = getattr(widget, bindname)
+                for binding in bindings:
+                    bindfunc(tag, binding, script)
 
         def bind(
             self, widget=None, tag=None,
@@ -847,49 +1278,111 @@ with PublicScope(state=globals()):
         for thing in it:
             yield thing
 
+    def _iter_bindings(item):
+        """Iterate on (name, _BoundBindings) members like memberit.
+
+        Only Bindings (and already bound) values of the raw class
+        __dict__ are looked up with getattr so unrelated members are
+        not touched.  Equivalent to filter(_BOUND_FILTER, memberit(item)).
+        """
+        cls = item if isinstance(item, type) else type(item)
+        for name, value in cls.__dict__.items():
+            if isinstance(value, (Bindings, _BoundBindings)):
+                value = getattr(item, name)
+                if isinstance(value, _BoundBindings):
+                    yield name, value
+
+    # Filters are memoized so repeated calls share one closure.
+    _FILTERS = {}
+
     def filterclass(cls):
         """Return filter for dictitem values that are instances of cls."""
-        def filt(thing):
-            return isinstance(thing[1], cls)
+        filt = _FILTERS.get((filterclass, cls))
+        if filt is None:
+            def filt(thing):
+                return isinstance(thing[1], cls)
+            _FILTERS[filterclass, cls] = filt
         return filt
 
     def filterprefix(prefix):
         """Return filter for dictitem keys that start with prefix."""
-        def filt(thing):
-            return thing[0].startswith(prefix)
+        filt = _FILTERS.get((filterprefix, prefix))
+        if filt is None:
+            def filt(thing):
+                return thing[0].startswith(prefix)
+            _FILTERS[filterprefix, prefix] = filt
         return filt
 
     def root(widget):
         """Get widget root.
 
         widget._root is documented as "Internal function."
+        The root is cached as _tkutil_root on the widget and every
+        ancestor walked through (tkinter widgets cannot be reparented).
+        The walk stops early at an ancestor that already has it.
         """
+        top = widget.__dict__.get('_tkutil_root')
+        if top is not None:
+            return top
+        path = []
         master = widget.master
         while master is not None:
+            path.append(widget)
+            top = master.__dict__.get('_tkutil_root')
+            if top is not None:
+                break
             widget = master
             master = widget.master
-        return widget
+        else:
+            top = widget
+        for node in path:
+            node.__dict__['_tkutil_root'] = top
+        return top
+
+    _BOUND_FILTER = filterclass(_BoundBindings)
 
     def add_bindings(
         widget, tag=None, first=True, bindfunc='bind_class',
-        tupit=None, filt=filterclass(_BoundBindings), **kwargs):
+        tupit=None, filt=_BOUND_FILTER, **kwargs):
         """Bind Binding instances.
 
         widget: widget to use for binding.
         tupit: iterator of tuple: name to Bindings instance.  Defaults
             to memberit(widget)
+        filt: filter for tupit items, None if tupit needs no filtering.
         tag: bind tag to use, defaults to str(widget).
         first: If bindings already exist for the tag, do nothing.
         kwargs: see Bindings.[tag_]bind()
+        When binding several items, existing commands are listed once
+        instead of checking each funcid separately.
         """
         if tupit is None:
-            tupit = memberit(widget)
+            if filt is _BOUND_FILTER:
+                tupit = _iter_bindings(widget)
+                filt = None
+            else:
+                tupit = memberit(widget)
         if tag is None:
             tag = str(widget)
         if first and getattr(widget, bindfunc)(tag):
             return
-        for name, item in filter(filt, tupit):
+        if filt is None:
+            items = [item for name, item in tupit]
+        else:
+            items = [thing[1] for thing in tupit if filt(thing)]
+        pairs = None
+        if len(items) > 1:
+            if kwargs.get('existing') is None:
+                kwargs['existing'] = _tcl_commands(widget)
+            if (
+                bindfunc == 'bind_class' and kwargs.get('pairs') is None
+                and _stock_bind_class(widget)):
+                # Bind everything with a single Tcl call.
+                pairs = kwargs['pairs'] = []
+        for item in items:
             item.bind_(bindfunc, widget, tag, **kwargs)
+        if pairs:
+            widget.tk.call('apply', _BIND_PAIRS, tag, *pairs)
 
     class Behavior(object):
         """Class for acting as a namespace containing Bindings callbacks."""
@@ -897,10 +1390,23 @@ with PublicScope(state=globals()):
         @classmethod
         def bind(
             cls, widget, tag=None, first=True, bindfunc='bind_class',
-            tupit=None, filt=filterclass(_BoundBindings), **kwargs):
-            """Call add_bindings on this class."""
+            tupit=None, filt=_BOUND_FILTER, **kwargs):
+            """Call add_bindings on this class.
+
+            With the default tupit and filt, the filtered members are
+            cached on the class as _tkutil_bindings.
+            """
             if tupit is None:
-                tupit = memberit(cls)
+                if filt is _BOUND_FILTER:
+                    try:
+                        tupit = cls.__dict__['_tkutil_bindings']
+                    except KeyError:
+                        tupit = list(_iter_bindings(cls))
+                        cls._tkutil_bindings = tupit
+                    # Already filtered.
+                    filt = None
+                else:
+                    tupit = memberit(cls)
             if bindfunc == 'tag_bind':
                 if tag is None:
                     tag = cls.__name__
@@ -910,8 +1416,17 @@ with PublicScope(state=globals()):
 
     class Var(object):
         """Wrap a Var, call appropriate trace method."""
+        __slots__ = ('_var', 'get', 'set', 'trace_add')
         def __init__(self, var):
             self._var = var
+            self.get = var.get
+            self.set = var.set
+            trace_add = getattr(var, 'trace_add', None)
+            if trace_add is None:
+                trace = var.trace
+                def trace_add(mode, callback):
+                    return trace(mode[:1], callback)
+            self.trace_add = trace_add
 
         def __str__(self):
             return str(self._var)
@@ -919,18 +1434,8 @@ with PublicScope(state=globals()):
             return repr(self._var)
 
         def __getattr__(self, name):
-            try:
-                ret = getattr(self._var, name)
-            except AttributeError:
-                if name == 'trace_add':
-                    def trace_add(mode, callback):
-                        return self.trace(mode[:1], callback)
-                    self.trace_add = trace_add
-                    return trace_add
-                raise
-            if callable(ret):
-                setattr(self, name, ret)
-            return ret
+            """Forward everything else to the Var."""
+            return getattr(self._var, name)
 
     class App(tk.Tk, object):
         """A tkinter.Tk() with binding to escape for exit.
@@ -950,17 +1455,25 @@ with PublicScope(state=globals()):
         def __destroy(self):
             self.destroy()
 
+    _XOFFSETS = {}
     def get_window_xoffset(widget):
         """Return a delta that places the window on left of screen.
 
         Because of the window manager, 0 is not necessarily at the left
         edge of the screen.  This doesn't seem to happen for y
+        The offset is measured once per screen and then cached.
         """
+        screen = widget.winfo_screen()
+        offset = _XOFFSETS.get(screen)
+        if offset is not None:
+            return offset
         tl = tk.Toplevel(widget)
         try:
             tl.update_idletasks()
-            return tl.winfo_x() - tl.winfo_rootx()
+            offset = _XOFFSETS[screen] = tl.winfo_x() - tl.winfo_rootx()
+            return offset
         except Exception:
+            import traceback
             traceback.print_exc()
             return 0
         finally:
@@ -8,8 +8,7 @@ setup(
     author='Jason Hsiao',
     author_email='oaishnosaj@gmail.com',
     description='tkinter helpers',
-    packages=['jhsiao'],
-    py_modules=['jhsiao.tkutil.util'],
+    packages=['jhsiao', 'jhsiao.tkutil'],
     install_requires=[
         'jhsiao-utils @ git+https://github.com/j-hsiao/py-utils.git',
         'jhsiao-exports @ git+https://github.com/j-hsiao/py-exports.git'